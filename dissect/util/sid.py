@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import io
+import functools
 import struct
 from typing import BinaryIO
 
 
+@functools.cache
+def _sub_authority_struct(endian: str, count: int) -> struct.Struct:
+    """Return a (cached) ``struct.Struct`` for unpacking ``count`` sub authorities."""
+    return struct.Struct(f"{endian}{count}I")
+
+
 def read_sid(fh: BinaryIO | bytes, endian: str = "<", swap_last: bool = False) -> str:
     """Read a Windows SID from bytes.
 
@@ -26,25 +32,43 @@ def read_sid(fh: BinaryIO | bytes, endian: str = "<", swap_last: bool = False) -
         swap_list: Optional flag for swapping the endianess of the _last_ sub authority entry.
     """
     if isinstance(fh, bytes):
-        fh = io.BytesIO(fh)
+        # Only use the bytes that make up the SID, so trailing data doesn't end up in the cache
+        buf = fh[: 8 + fh[1] * 4] if len(fh) >= 8 else fh
+    else:
+        # Read the header and the sub authorities from the file-like object, so both inputs share a single code path
+        buf = fh.read(8)
+        if len(buf) == 8:
+            buf += fh.read(buf[1] * 4)
+        # Some file-like objects return a bytearray, which can't be used as a cache key
+        buf = bytes(buf)
+
+    return _read_sid(buf, endian, swap_last)
+
 
-    if len(buf := fh.read(8)) != 8:
+@functools.lru_cache(maxsize=4096)
+def _read_sid(buf: bytes, endian: str, swap_last: bool) -> str:
+    """Parse a Windows SID from bytes.
+
+    The same SIDs tend to be parsed over and over again, so the results are cached.
+    """
+    if len(buf) < 8:
         return ""
 
-    revision = buf[0]
-    sub_authority_count = buf[1]
-    authority = int.from_bytes(buf[2:], "big")
+    # The header is always big endian, so decode it with a single load
+    header = int.from_bytes(buf[:8], "big")
+    revision = header >> 56
+    sub_authority_count = (header >> 48) & 0xFF
+    authority = header & 0xFFFFFFFFFFFF
+
+    sub_authorities = _sub_authority_struct(endian, sub_authority_count).unpack_from(buf, 8)
 
-    sub_authority_buf = bytearray(fh.read(sub_authority_count * 4))
     if sub_authority_count and swap_last:
-        sub_authority_buf[-4:] = sub_authority_buf[-4:][::-1]
+        # Swap the bytes of only the last sub authority instead of swapping the bytes in a copy of the whole buffer
+        end = 8 + sub_authority_count * 4
+        (last,) = _sub_authority_struct(endian, 1).unpack(buf[end - 4 : end][::-1])
+        sub_authorities = (*sub_authorities[:-1], last)
 
-    sub_authorities = struct.unpack(f"{endian}{sub_authority_count}I", sub_authority_buf)
+    if not sub_authorities:
+        return f"S-{revision}-{authority}"
 
-    sid_elements = [
-        "S",
-        f"{revision}",
-        f"{authority}",
-    ]
-    sid_elements.extend(map(str, sub_authorities))
-    return "-".join(sid_elements)
+    return f"S-{revision}-{authority}-" + "-".join([str(value) for value in sub_authorities])
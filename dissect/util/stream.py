@@ -272,6 +272,9 @@ class MappingStream(AlignedStream):
     def __init__(self, size: int | None = None, align: int = STREAM_BUFFER_SIZE):
         super().__init__(size, align)
         self._runs: list[tuple[int, int, BinaryIO, int]] = []
+        self._runs_offsets: list[int] = []
+        # The highest end offset of all runs up to and including each index, for bisecting on overlapping runs
+        self._runs_max_ends: list[int] = []
 
     def add(self, offset: int, size: int, fh: BinaryIO, file_offset: int = 0) -> None:
         """Add a file-like object to the stream.
@@ -284,8 +287,17 @@ class MappingStream(AlignedStream):
 
         Note that there is no check on overlapping offsets and/or sizes.
         """
-        self._runs.append((offset, size, fh, file_offset))
-        self._runs = sorted(self._runs, key=lambda run: run[0])
+        # Keep the runs sorted on offset, runs with the same offset are kept in the order they were added
+        idx = bisect_right(self._runs_offsets, offset)
+        self._runs.insert(idx, (offset, size, fh, file_offset))
+        self._runs_offsets.insert(idx, offset)
+
+        max_end = self._runs_max_ends[idx - 1] if idx else 0
+        del self._runs_max_ends[idx:]
+        for run_offset, run_size, _, _ in self._runs[idx:]:
+            max_end = max(max_end, run_offset + run_size)
+            self._runs_max_ends.append(max_end)
+
         self._buf = None
         self.size = self._runs[-1][0] + self._runs[-1][1]
 
@@ -301,8 +313,13 @@ class MappingStream(AlignedStream):
         Raises:
             IOError: If no mapping is found for the given offset.
         """
-        for idx, run in enumerate(self._runs):
-            if run[0] <= offset < run[0] + run[1]:
+        # All runs before this index end at or before the offset, so start looking for the first containing run here
+        for idx in range(bisect_right(self._runs_max_ends, offset), len(self._runs)):
+            run_offset, run_size, _, _ = self._runs[idx]
+            if run_offset > offset:
+                break
+
+            if offset < run_offset + run_size:
                 return idx
 
         raise EOFError(f"No mapping for offset {offset}")
@@ -475,13 +492,15 @@ class OverlayStream(AlignedStream):
             raise ValueError("Size must be positive")
 
         # Check if there are overlapping overlays
-        for other_offset, (other_size, _) in self.overlays.items():
+        # Existing overlays never overlap each other, so only the direct neighbours need to be checked
+        idx = bisect_left(self._lookup, offset)
+        for other_offset in self._lookup[max(0, idx - 1) : idx + 1]:
+            other_size, _ = self.overlays[other_offset]
             if other_offset < offset + size and offset < other_offset + other_size:
                 raise ValueError(f"Overlap with existing overlay: ({other_offset, other_size})")
 
         self.overlays[offset] = (size, data)
-        self._lookup.append(offset)
-        self._lookup.sort()
+        self._lookup.insert(idx, offset)
 
         # Clear the buffer if we add an overlay at our current position
         if self._buf and (self._pos_align <= offset + size and offset <= self._pos_align + len(self._buf)):
@@ -588,8 +607,10 @@ class ZlibStream(AlignedStream):
         if offset < self._zlib_offset:
             self._rewind()
 
+        # Skip forward in larger chunks than the alignment, the decompressed data is discarded anyway
+        skip_size = max(self.align, 1024 * 1024)
         while self._zlib_offset < offset:
-            read_size = min(offset - self._zlib_offset, self.align)
+            read_size = min(offset - self._zlib_offset, skip_size)
             if self._read_zlib(read_size) == b"":
                 break
 
@@ -4,23 +4,29 @@ import struct
 import sys
 from datetime import datetime, timedelta, timezone, tzinfo
 
-if sys.platform in ("win32", "emscripten"):
-    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-    def _calculate_timestamp(ts: float) -> datetime:
-        """Calculate timestamps relative from Unix epoch.
 
-        Python on Windows and WASM (Emscripten) have problems calculating timestamps before 1970 (Unix epoch).
-        Calculating relatively from the epoch is required to correctly calculate those timestamps.
-        This method is slower, so we split the implementation between Windows, WASM and other platforms.
-        """
-        return _EPOCH + timedelta(seconds=ts)
+def _calculate_timestamp_epoch(ts: float) -> datetime:
+    """Calculate timestamps relative from Unix epoch.
+
+    Python on Windows and WASM (Emscripten) have problems calculating timestamps before 1970 (Unix epoch).
+    Calculating relatively from the epoch is required to correctly calculate those timestamps.
+    This method is slower, so we split the implementation between Windows, WASM and other platforms.
+    """
+    return _EPOCH + timedelta(seconds=ts)
 
-else:
 
-    def _calculate_timestamp(ts: float) -> datetime:
-        """Calculate timestamps normally."""
-        return datetime.fromtimestamp(ts, tz=timezone.utc)
+def _calculate_timestamp_native(ts: float) -> datetime:
+    """Calculate timestamps normally."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+# Select the implementation once, all timestamp functions look up ``_calculate_timestamp`` at call time
+if sys.platform in ("win32", "emscripten"):
+    _calculate_timestamp = _calculate_timestamp_epoch
+else:
+    _calculate_timestamp = _calculate_timestamp_native
 
 
 def now() -> datetime:
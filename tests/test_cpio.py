@@ -11,10 +11,16 @@ def absolute_path(filename: str) -> Path:
     return Path(__file__).parent / filename
 
 
+_EXPECTED_NAMES = frozenset(
+    [f"dir/file_{i}" for i in range(1, 101)] + ["large-file", "small-file", "symlink-1", "symlink-2"]
+)
+_LARGE_EXPECTED = b"".join([bytes([i] * 4096) for i in range(255)]) * 4
+
+
 def _verify_archive(archive: TarFile) -> None:
-    assert sorted(archive.getnames()) == sorted(
-        [f"dir/file_{i}" for i in range(1, 101)] + ["large-file", "small-file", "symlink-1", "symlink-2"]
-    )
+    names = archive.getnames()
+    assert len(names) == len(_EXPECTED_NAMES)
+    assert set(names) == _EXPECTED_NAMES
 
     small_file = archive.getmember("small-file")
     assert small_file.name == "small-file"
@@ -26,7 +32,7 @@ def _verify_archive(archive: TarFile) -> None:
     assert large_file.name == "large-file"
     assert large_file.size == 0x3FC000
     assert small_file.isfile()
-    assert archive.extractfile(large_file).read() == b"".join([bytes([i] * 4096) for i in range(255)]) * 4
+    assert archive.extractfile(large_file).read() == _LARGE_EXPECTED
 
     symlink_1 = archive.getmember("symlink-1")
     assert symlink_1.issym()
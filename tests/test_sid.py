@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import struct
+import sys
 from typing import BinaryIO
 
 import pytest
@@ -8,18 +10,23 @@ import pytest
 from dissect.util import sid
 
 
-def id_fn(val: bytes | str) -> str:
-    if isinstance(val, io.BytesIO):
-        val = val.getvalue()
+# A SID with the last sub authority swapped, laid out in the host's native byte order
+_NATIVE_SWAPPED_SID = (
+    b"\x01\x04\x00\x00\x00\x00\x00\x05\x15\x00\x00\x00\x15\xcd\x5b\x07\x00\x00\x00\x10\x00\x00\x01\xf4"
+    if sys.byteorder == "little"
+    else b"\x01\x04\x00\x00\x00\x00\x00\x05\x00\x00\x00\x15\x07\x5b\xcd\x15\x10\x00\x00\x00\xf4\x01\x00\x00"
+)
+
 
-    if isinstance(val, str):
+def id_fn(val: bytes | str) -> str:
+    if type(val) is str:
         return val
 
-    if val == b"":
-        return "empty-value"
+    if type(val) is io.BytesIO:
+        val = val.getvalue()
 
-    if isinstance(val, bytes):
-        return val.hex()
+    if type(val) is bytes:
+        return val.hex() if val else "empty-value"
 
     if val is None:
         return "None"
@@ -72,6 +79,18 @@ def id_fn(val: bytes | str) -> str:
             ">",
             True,
         ),
+        (
+            _NATIVE_SWAPPED_SID,
+            "S-1-5-21-123456789-268435456-500",
+            "=",
+            True,
+        ),
+        (
+            _NATIVE_SWAPPED_SID,
+            "S-1-5-21-123456789-268435456-500",
+            "@",
+            True,
+        ),
         (
             b"",
             "",
@@ -83,3 +102,49 @@ def id_fn(val: bytes | str) -> str:
 )
 def test_read_sid(binary_sid: bytes | BinaryIO, endian: str, swap_last: bool, readable_sid: str) -> None:
     assert readable_sid == sid.read_sid(binary_sid, endian, swap_last)
+
+
+def test_read_sid_trailing_data() -> None:
+    buf = b"\x01\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00" + b"\xff" * 64
+    assert sid.read_sid(buf) == "S-1-1-0"
+
+
+def test_read_sid_cached() -> None:
+    buf = b"\x01\x02\x00\x00\x00\x00\x00\x05\x20\x00\x00\x00\x20\x02\x00\x00"
+
+    sid._read_sid.cache_clear()
+    assert sid.read_sid(buf) == "S-1-5-32-544"
+    assert sid.read_sid(bytes(buf)) == "S-1-5-32-544"
+    assert sid.read_sid(io.BytesIO(buf)) == "S-1-5-32-544"
+
+    cache_info = sid._read_sid.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_read_sid_fh_position() -> None:
+    fh = io.BytesIO(b"\x01\x01\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00" + b"\xff" * 64)
+    assert sid.read_sid(fh) == "S-1-1-0"
+    assert fh.tell() == 12
+
+
+def test_read_sid_fh_bytearray() -> None:
+    class BytearrayIO(io.BytesIO):
+        def read(self, size: int = -1) -> bytearray:
+            return bytearray(super().read(size))
+
+    fh = BytearrayIO(b"\x01\x02\x00\x00\x00\x00\x00\x05\x20\x00\x00\x00\x20\x02\x00\x00")
+    assert sid.read_sid(fh) == "S-1-5-32-544"
+
+
+@pytest.mark.parametrize(
+    "binary_sid",
+    [
+        b"\x01\x02\x00\x00\x00\x00\x00\x05\x20\x00\x00\x00",
+        io.BytesIO(b"\x01\x02\x00\x00\x00\x00\x00\x05\x20\x00\x00\x00"),
+    ],
+    ids=["bytes", "fh"],
+)
+def test_read_sid_truncated(binary_sid: bytes | BinaryIO) -> None:
+    with pytest.raises(struct.error):
+        sid.read_sid(binary_sid)
@@ -108,6 +108,48 @@ def test_mapping_stream_same_offset() -> None:
 
     assert fh._runs[0][2] == buffers[0]
     assert fh._runs[1][2] == buffers[1]
+    assert fh._get_run_idx(512) == 0
+
+
+def test_mapping_stream_run_lookup() -> None:
+    fh = stream.MappingStream(align=512)
+    for i in reversed(range(16)):
+        fh.add(i * 1024, 512, io.BytesIO(bytes([i]) * 512))
+
+    assert fh._get_run_idx(0) == 0
+    assert fh._get_run_idx(5 * 1024 + 511) == 5
+    assert fh._get_run_idx(15 * 1024) == 15
+
+    with pytest.raises(EOFError, match="No mapping for offset 1536"):
+        fh._get_run_idx(1536)
+
+    fh.seek(7 * 1024)
+    assert fh.read(512) == b"\x07" * 512
+
+
+def test_mapping_stream_same_offset_different_size() -> None:
+    fh = stream.MappingStream(align=512)
+    fh.add(0, 512, io.BytesIO(b"\x01" * 512))
+    fh.add(0, 1024, io.BytesIO(b"\x02" * 1024))
+
+    assert fh._get_run_idx(0) == 0
+    assert fh._get_run_idx(600) == 1
+
+    fh.seek(600)
+    assert fh.read(16) == b"\x02" * 16
+
+
+def test_mapping_stream_nested_overlap() -> None:
+    fh = stream.MappingStream(align=512)
+    fh.add(0, 2048, io.BytesIO(b"\x01" * 2048))
+    fh.add(512, 2048, io.BytesIO(b"\x02" * 2048))
+
+    # The first run that contains the offset wins
+    assert fh._get_run_idx(1100) == 0
+    assert fh._get_run_idx(2100) == 1
+
+    fh.seek(1100)
+    assert fh.read(16) == b"\x01" * 16
 
 
 def test_runlist_stream() -> None:
@@ -188,6 +230,25 @@ def test_overlay_stream() -> None:
     assert fh.read(100) == b"\x04" * 4
 
 
+def test_overlay_stream_overlap() -> None:
+    fh = stream.OverlayStream(io.BytesIO(b"\x00" * 4096), size=4096, align=512)
+    for offset in range(0, 4096, 256):
+        fh.add(offset, b"\xff" * 16)
+
+    # Overlaps with the preceding overlay
+    with pytest.raises(ValueError, match="Overlap with existing overlay: \\(\\(1024, 16\\)\\)"):
+        fh.add(1030, b"\x01" * 4)
+
+    # Overlaps with the following overlays
+    with pytest.raises(ValueError, match="Overlap with existing overlay: \\(\\(1280, 16\\)\\)"):
+        fh.add(1040, b"\x01" * 1024)
+
+    # Fits exactly between two overlays
+    fh.add(1040, b"\x01" * 240)
+    fh.seek(1024)
+    assert fh.read(512) == (b"\xff" * 16) + (b"\x01" * 240) + (b"\xff" * 16) + (b"\x00" * 240)
+
+
 def test_zlib_stream() -> None:
     data = b"\x01" * 8192 + b"\x02" * 8192 + b"\x03" * 8192 + b"\x04" * 8192
     fh = stream.ZlibStream(io.BytesIO(zlib.compress(data)), size=8192 * 4, align=512)
@@ -217,3 +278,21 @@ def test_zlib_stream() -> None:
 
     fh.seek(0)
     assert fh.read() == data
+
+
+def test_zlib_stream_forward_seek() -> None:
+    data = b"".join(bytes([i]) * (512 * 1024) for i in range(8))
+    fh = stream.ZlibStream(io.BytesIO(zlib.compress(data)), size=len(data), align=512)
+
+    assert fh.read(512) == b"\x00" * 512
+
+    patch_rewind = patch.object(fh, "_rewind", wraps=fh._rewind)
+    patch_read_zlib = patch.object(fh, "_read_zlib", wraps=fh._read_zlib)
+    with patch_rewind as mock_rewind, patch_read_zlib as mock_read_zlib:
+        # Skip forward over more than 1 MiB, so the skip loop needs multiple iterations
+        fh.seek(len(data) - 1024)
+        assert fh.read(1024) == b"\x07" * 1024
+
+        mock_rewind.assert_not_called()
+        # 4 skip iterations of at most 1 MiB each, plus the actual read
+        assert mock_read_zlib.call_count == 5
@@ -1,25 +1,43 @@
-import platform
+from __future__ import annotations
+
+import sys
 from datetime import datetime, timedelta, timezone
-from importlib import reload
-from types import ModuleType
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        "epoch",
+        pytest.param(
+            "native",
+            marks=pytest.mark.skipif(
+                sys.platform in ("win32", "emscripten"),
+                reason="datetime.fromtimestamp() does not support timestamps before 1970 on this platform",
+            ),
+        ),
+    ],
+)
+def imported_ts(request: pytest.FixtureRequest) -> Iterator[ModuleType]:
+    # Windows and WASM (Emscripten) use the epoch implementation, other platforms use the native one
+    from dissect.util import ts
 
-@pytest.fixture(params=["windows", "emscripten", "linux"])
-def imported_ts(request: pytest.FixtureRequest) -> ModuleType:
-    with patch.object(platform, "system", return_value=request.param):
-        from dissect.util import ts
-
-        return reload(ts)
+    with patch.object(ts, "_calculate_timestamp", getattr(ts, f"_calculate_timestamp_{request.param}")):
+        yield ts
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ts() -> ModuleType:
     from dissect.util import ts
 
-    return reload(ts)
+    return ts
 
 
 def test_now(ts: ModuleType) -> None:
@@ -60,60 +78,34 @@ def test_unix_now_ns(imported_ts: ModuleType) -> None:
     assert imported_ts.from_unix_ns(timestamp).microsecond == int((timestamp // 1000) % 1e6)
 
 
-def test_to_unix(ts: ModuleType) -> None:
-    dt = datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc)
-    assert ts.to_unix(dt) == 1523489672
-
-
-def test_to_unix_ms(ts: ModuleType) -> None:
-    dt = datetime(2018, 4, 11, 23, 34, 32, 915000, tzinfo=timezone.utc)
-    assert ts.to_unix_ms(dt) == 1523489672915
-
-
-def test_to_unix_us(ts: ModuleType) -> None:
-    dt = datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc)
-    assert ts.to_unix_us(dt) == 1523489672915138
-
-
-def test_to_unix_ns(ts: ModuleType) -> None:
-    dt = datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc)
-    assert ts.to_unix_ns(dt) == 1523489672915138000
-
-
-def test_from_unix(imported_ts: ModuleType) -> None:
-    assert imported_ts.from_unix(1523489672) == datetime(2018, 4, 11, 23, 34, 32, tzinfo=timezone.utc)
-
-
-def test_from_unix_ms(imported_ts: ModuleType) -> None:
-    assert imported_ts.from_unix_ms(1511260448882) == datetime(2017, 11, 21, 10, 34, 8, 882000, tzinfo=timezone.utc)
-
-
-def test_from_unix_us(imported_ts: ModuleType) -> None:
-    assert imported_ts.from_unix_us(1511260448882000) == datetime(2017, 11, 21, 10, 34, 8, 882000, tzinfo=timezone.utc)
-
-
-def test_from_unix_ns(imported_ts: ModuleType) -> None:
-    assert imported_ts.from_unix_ns(1523489672915138048) == datetime(
-        2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc
-    )
-
-
-def test_xfstimestamp(imported_ts: ModuleType) -> None:
-    assert imported_ts.xfstimestamp(1582541380, 451742903) == datetime(
-        2020, 2, 24, 10, 49, 40, 451743, tzinfo=timezone.utc
-    )
-
-
-def test_ufstimestamp(imported_ts: ModuleType) -> None:
-    assert imported_ts.ufstimestamp(1582541380, 451742903) == datetime(
-        2020, 2, 24, 10, 49, 40, 451743, tzinfo=timezone.utc
-    )
-
-
-def test_wintimestamp(imported_ts: ModuleType) -> None:
-    assert imported_ts.wintimestamp(131679632729151386) == datetime(
-        2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc
-    )
+@pytest.mark.parametrize(
+    ("func", "dt", "expected"),
+    [
+        ("to_unix", datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc), 1523489672),
+        ("to_unix_ms", datetime(2018, 4, 11, 23, 34, 32, 915000, tzinfo=timezone.utc), 1523489672915),
+        ("to_unix_us", datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc), 1523489672915138),
+        ("to_unix_ns", datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc), 1523489672915138000),
+    ],
+)
+def test_to_unix(ts: ModuleType, func: str, dt: datetime, expected: int) -> None:
+    assert getattr(ts, func)(dt) == expected
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "expected"),
+    [
+        ("from_unix", (1523489672,), datetime(2018, 4, 11, 23, 34, 32, tzinfo=timezone.utc)),
+        ("from_unix_ms", (1511260448882,), datetime(2017, 11, 21, 10, 34, 8, 882000, tzinfo=timezone.utc)),
+        ("from_unix_us", (1511260448882000,), datetime(2017, 11, 21, 10, 34, 8, 882000, tzinfo=timezone.utc)),
+        ("from_unix_ns", (1523489672915138048,), datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc)),
+        ("xfstimestamp", (1582541380, 451742903), datetime(2020, 2, 24, 10, 49, 40, 451743, tzinfo=timezone.utc)),
+        ("ufstimestamp", (1582541380, 451742903), datetime(2020, 2, 24, 10, 49, 40, 451743, tzinfo=timezone.utc)),
+        ("wintimestamp", (131679632729151386,), datetime(2018, 4, 11, 23, 34, 32, 915138, tzinfo=timezone.utc)),
+        ("webkittimestamp", (13261574439236538,), datetime(2021, 3, 30, 10, 40, 39, 236538, tzinfo=timezone.utc)),
+    ],
+)
+def test_from_timestamp(imported_ts: ModuleType, func: str, args: tuple[int, ...], expected: datetime) -> None:
+    assert getattr(imported_ts, func)(*args) == expected
 
 
 def test_oatimestamp(imported_ts: ModuleType) -> None:
@@ -123,12 +115,6 @@ def test_oatimestamp(imported_ts: ModuleType) -> None:
     assert imported_ts.oatimestamp(-4542644417712532139) == datetime(1661, 4, 17, 11, 30, tzinfo=timezone.utc)
 
 
-def test_webkittimestamp(imported_ts: ModuleType) -> None:
-    assert imported_ts.webkittimestamp(13261574439236538) == datetime(
-        2021, 3, 30, 10, 40, 39, 236538, tzinfo=timezone.utc
-    )
-
-
 def test_cocoatimestamp(imported_ts: ModuleType) -> None:
     assert imported_ts.cocoatimestamp(622894123) == datetime(2020, 9, 27, 10, 8, 43, tzinfo=timezone.utc)
     assert imported_ts.cocoatimestamp(622894123.221783) == datetime(2020, 9, 27, 10, 8, 43, 221783, tzinfo=timezone.utc)